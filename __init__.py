@@ -1,6 +1,6 @@
 import os
 from website import create_app, register_blueprints
-from flask.ext.mongoengine import MongoEngine
+from flask_mongoengine import MongoEngine
 
 if os.getenv('PRODUCTION', False):
     app = create_app('website.config.Config')
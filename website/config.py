@@ -4,7 +4,12 @@ class Config(object):
     # General
     DEBUG = False
     TESTING = False
-    MONGODB_SETTINGS = {'DB': "datadabble"}
+    MONGODB_SETTINGS = {
+        'DB': "datadabble",
+        # One pooled client per worker process, opened by MongoEngine(app)
+        'MAX_POOL_SIZE': 100,
+        'WAITQUEUETIMEOUTMS': 2000
+    }
     SECRET_KEY = "KeepThisS3cr3t"
 
 class DevelopmentConfig(Config):
@@ -1,12 +1,9 @@
 import datetime
 
-from mongoengine import *
 from flask import url_for
 from datadabble import db
 
-connect('datadabble')
-
-class User(Document):
+class User(db.Document):
 	created_at = db.DateTimeField(default=datetime.datetime.now(), required=True)
 	updated_at = db.DateTimeField(default=datetime.datetime.now(), required=True)
 	email = db.StringField(required=True)
@@ -14,12 +11,12 @@ class User(Document):
 	last_name = db.StringField(max_length=50)
 	password = db.StringField(max_length=50)
 
-class Database(Document):
+class Database(db.Document):
 	created_at = db.DateTimeField(default=datetime.datetime.now(), required=True)
 	updated_at = db.DateTimeField(default=datetime.datetime.now(), required=True)
 	title = db.StringField(max_length=120, required=True)
 	slug = db.StringField(max_length=120, required=True)
-	user = db.ReferenceField(User, reverse_delete_rule=CASCADE)
+	user = db.ReferenceField(User, reverse_delete_rule=db.CASCADE)
 
 	def get_absolute_url(self):
 		return url_for('post', kwargs={"slug": self.slug})
@@ -29,7 +26,12 @@ class Database(Document):
 
 	meta = {
 		'allow_inheritance': True,
-		'indexes': ['-created_at', 'slug'],
+		'indexes': [
+			'-created_at',
+			'slug',
+			('user', '-created_at'),
+			{'fields': ['user', 'slug'], 'unique': True}
+		],
 		'ordering': ['-created_at']
 	}
 
@@ -43,15 +45,23 @@ FIELD_TYPE = (('BOOL', 'Boolean'),
 			('DICT', 'Dictionary'),
 			('LIST', 'List'))
 
-class Field(Document):
+class Field(db.Document):
 	created_at = db.DateTimeField(default=datetime.datetime.now(), required=True)
 	updated_at = db.DateTimeField(default=datetime.datetime.now(), required=True)
-	database = db.ReferenceField(Database, reverse_delete_rule=CASCADE)
+	database = db.ReferenceField(Database, reverse_delete_rule=db.CASCADE)
 	name = db.StringField(max_length=120)
 	type = db.StringField(max_length=5, choices=FIELD_TYPE)
 
-class Entry(Document):
+	meta = {
+		'indexes': ['database']
+	}
+
+class Entry(db.Document):
 	created_at = db.DateTimeField(default=datetime.datetime.now(), required=True)
 	updated_at = db.DateTimeField(default=datetime.datetime.now(), required=True)
-	database = db.ReferenceField(Database, reverse_delete_rule=CASCADE)
+	database = db.ReferenceField(Database, reverse_delete_rule=db.CASCADE)
 	values = db.DictField()
+
+	meta = {
+		'indexes': [('database', '-id')]
+	}